@@ -1,25 +1,31 @@
 """Pro plan usage monitoring and checking"""
 
+import logging
 import os
 import re
+import selectors
 import shlex
+import shutil
 import string
 import subprocess
 import sys
+import threading
 import time
 from contextlib import suppress
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 
 try:  # pragma: no cover - platform dependent
     import pty
 except (ImportError, AttributeError):
     pty = None  # type: ignore[misc,assignment]
 
-if pty is not None:  # pragma: no cover - platform dependent
-    import select
-else:  # pragma: no cover - platform dependent
-    select = None  # type: ignore[assignment]
+# google-re2 matches in linear time, which helps on large PTY redraw buffers.
+try:  # pragma: no cover - optional dependency
+    import re2 as _re_engine
+except ImportError:  # pragma: no cover - optional dependency
+    _re_engine = re  # type: ignore[assignment]
 
 from sleepless_agent.monitoring.logging import get_logger
 
@@ -27,6 +33,43 @@ logger = get_logger(__name__)
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+# Terminal control sequences emitted by the interactive CLI
+_ANSI_ESC_RE = _re_engine.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+_OSC_RE = _re_engine.compile(r"\x1B\][^\x07]*(?:\x07|\x1B\\)")
+
+# Map non-printable Latin-1 code points to spaces; anything wider is handled by _NON_ASCII_RE
+_PRINTABLE_CHARS = frozenset(string.printable)
+_PRINTABLE_TRANSLATE = {i: " " for i in range(256) if chr(i) not in _PRINTABLE_CHARS}
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+_NON_PRINTABLE_RE = re.compile(r"[^\t\n\x0b\x0c\r\x20-\x7e]")
+
+# Usage percentage formats
+_USAGE_KEYWORDS = ("used", "usage", "messages", "remaining", "limit")
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%\s*(?:used|usage|of|remaining)?", re.IGNORECASE)
+_USED_OF_TOTAL_RE = re.compile(r"used\s+(\d+)\s+of\s+(\d+)\s+messages", re.IGNORECASE)
+_MESSAGES_SLASH_RE = re.compile(r"Messages?:\s*(\d+)\s*/\s*(\d+)", re.IGNORECASE)
+_USED_REMAINING_RE = re.compile(r"(\d+)\s+messages?\s+used", re.IGNORECASE)
+_REMAINING_RE = re.compile(r"(\d+)\s+remaining", re.IGNORECASE)
+
+# Reset time formats, combined so the output is scanned once. Alternatives that can
+# start at the same position keep their original precedence (tz, at, in hm/h/m, next).
+_RESET_RE = re.compile(
+    r"(?P<tz>Resets\s+(?P<tz_hour>\d{1,2})(?::(?P<tz_minute>\d{2}))?\s*(?P<tz_meridiem>am|pm)\s+\((?P<tz_label>[^)]+)\))"
+    r"|(?P<at>Resets?\s+(?:at|@)\s+(?P<at_hour>\d{1,2}):(?P<at_minute>\d{2})(?::(?P<at_second>\d{2}))?\s*(?P<at_meridiem>am|pm)?"
+    r"(?:\s+\((?P<at_label>[^)]+)\)|\s+(?P<at_abbr>UTC|GMT|[A-Za-z/_-]+))?)"
+    r"|(?P<in_hm>Resets?\s+in\s+(?P<in_hm_hours>\d+)\s*(?:hours?|h)?\s+(?P<in_hm_minutes>\d+)\s*(?:minutes?|m)?)"
+    r"|(?P<in_h>Resets?\s+in\s+(?P<in_h_hours>\d+)\s*h)"
+    r"|(?P<in_m>Resets?\s+in\s+(?P<in_m_minutes>\d+)\s*m)"
+    r"|(?P<next>Next\s+reset[:\s]+(?P<next_hour>\d{1,2}):(?P<next_minute>\d{2})(?::(?P<next_second>\d{2}))?\s*(?P<next_label>UTC|GMT)?)",
+    re.IGNORECASE,
+)
+
+# Read size for PTY/pipe capture; matches the default Linux pipe buffer
+_READ_SIZE = 65536
+
+# Fixed offsets such as "UTC+5:30" (matched against an upper-cased label)
+_UTC_OFFSET_RE = re.compile(r"(?:UTC|GMT)?([+-])(\d{1,2})(?::?(\d{2}))?")
+
 
 class ProPlanUsageChecker:
     """Check Claude Code Pro plan usage via CLI, tracking percentage and reset time."""
@@ -67,27 +110,55 @@ class ProPlanUsageChecker:
             command: CLI command to run (default: "claude /usage")
         """
         self.command = command
-        self.last_check_time: Optional[datetime] = None
+        self._last_check_monotonic: Optional[float] = None
         self.cached_usage: Optional[Tuple[float, Optional[datetime]]] = None
         self.cache_duration_seconds = 60
         self.last_timezone_str: Optional[str] = None
+        self._last_tzinfo: Optional[tzinfo] = None
         self._last_logged_usage: Optional[Tuple[float, Optional[datetime]]] = None
+        self._command_args: Optional[Tuple[str, ...]] = None
+        self._command_source: Optional[str] = None
+        self._refresh_lock = threading.Lock()
 
     def get_usage(self) -> Tuple[float, Optional[datetime]]:
         """Execute CLI command and parse usage response as percentage plus reset time."""
         try:
             # Check cache first (valid for 60 seconds)
-            if self.cached_usage and self.last_check_time:
-                cache_age = (datetime.now(timezone.utc).replace(tzinfo=None) - self.last_check_time).total_seconds()
-                if cache_age < self.cache_duration_seconds:
-                    logger.debug(
-                        "usage.cache.hit",
-                        age_seconds=int(cache_age),
-                    )
-                    return self.cached_usage
+            cached = self._fresh_cached_usage()
+            if cached:
+                return cached
+
+            # Only one caller runs the CLI at a time; concurrent callers reuse its result
+            with self._refresh_lock:
+                cached = self._fresh_cached_usage()
+                if cached:
+                    return cached
+                return self._refresh_usage()
 
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.error("usage.command.exception", error=str(e))
+            raise
+
+    def _fresh_cached_usage(self) -> Optional[Tuple[float, Optional[datetime]]]:
+        """Return the cached usage if it is younger than the cache duration."""
+        if self.cached_usage and self._last_check_monotonic is not None:
+            cache_age = time.monotonic() - self._last_check_monotonic
+            if cache_age < self.cache_duration_seconds:
+                logger.debug(
+                    "usage.cache.hit",
+                    age_seconds=int(cache_age),
+                )
+                return self.cached_usage
+        return None
+
+    def _refresh_usage(self) -> Tuple[float, Optional[datetime]]:
+        """Run the CLI command, parse its output, and update the cache."""
+        # Re-tokenize only when the configured command changes
+        if self.command != self._command_source:
             try:
-                command_args = tuple(shlex.split(self.command))
+                self._command_args = tuple(shlex.split(self.command))
             except ValueError as exc:
                 logger.error(
                     "usage.command.invalid",
@@ -95,138 +166,182 @@ class ProPlanUsageChecker:
                     error=str(exc),
                 )
                 return self._fallback_usage()
+            self._command_source = self.command
+        command_args = self._command_args
 
-            raw_output, return_code = self._execute_command(command_args)
+        raw_output, return_code, needs_clean = self._execute_command(command_args)
+        # Pipe output is plain text unless the CLI forced escape sequences anyway
+        if needs_clean or "\x1B" in raw_output:
             cleaned_output = self._clean_command_output(raw_output)
+        else:
+            cleaned_output = raw_output.strip()
 
-            # Check for errors
-            if return_code not in (0, -15, -9):  # 0 = success, -15 = SIGTERM, -9 = SIGKILL
-                if cleaned_output:
-                    logger.warning(
-                        "usage.command.nonzero_exit",
-                        return_code=return_code,
-                    )
-                else:
-                    logger.error(
-                        "usage.command.failed",
-                        return_code=return_code,
-                    )
-
-            if not cleaned_output:
-                logger.warning("usage.command.empty_output")
-                return self._fallback_usage()
-
-            # Parse output
-            try:
-                usage_percent, reset_time = self._parse_usage_output(cleaned_output)
-            except RuntimeError as parse_error:
+        # Check for errors
+        if return_code not in (0, -15, -9):  # 0 = success, -15 = SIGTERM, -9 = SIGKILL
+            if cleaned_output:
                 logger.warning(
-                    "usage.parse_failed",
-                    error=str(parse_error),
+                    "usage.command.nonzero_exit",
+                    return_code=return_code,
                 )
-                return self._fallback_usage()
-
-            # Cache result
-            self.cached_usage = (usage_percent, reset_time)
-            self.last_check_time = datetime.now(timezone.utc).replace(tzinfo=None)
-
-            # Format reset time with timezone info if available
-            if reset_time:
-                if self.last_timezone_str:
-                    tz = self._resolve_timezone(self.last_timezone_str)
-                    if tz:
-                        reset_dt_tz = reset_time.replace(tzinfo=timezone.utc).astimezone(tz)
-                        reset_label = reset_dt_tz.strftime("%I:%M%p").lower() + f" ({self.last_timezone_str})"
-                    else:
-                        reset_label = reset_time.strftime("%H:%M:%S")
-                else:
-                    reset_label = reset_time.strftime("%H:%M:%S")
-            else:
-                reset_label = "unknown"
-
-            # Only log at significant milestones or major changes
-            # This reduces log noise from small fluctuations
-            previous_snapshot = self._last_logged_usage
-            should_log = False
-
-            if previous_snapshot is None:
-                # On first check, only log if usage is already significant (>=50%)
-                # This avoids startup noise when usage is low
-                if usage_percent >= 50.0:
-                    should_log = True
-                # Always cache it even if not logging
-                self._last_logged_usage = (usage_percent, reset_time)
             else:
-                prev_percent, prev_reset = previous_snapshot
-                percent_change = abs(usage_percent - prev_percent)
-                reset_changed = reset_time != prev_reset
-
-                # Log at 10% milestones (50%, 60%, 70%, 80%, 90%, 100%)
-                current_milestone = int(usage_percent / 10) * 10
-                prev_milestone = int(prev_percent / 10) * 10
-                crossed_milestone = current_milestone != prev_milestone and current_milestone >= 50
-
-                # Log if crossed a milestone OR if we're near threshold (every % counts)
-                if crossed_milestone or usage_percent >= 80.0:
-                    should_log = True
-                # Also log if reset time changed (new day/period)
-                elif reset_changed and prev_reset and reset_time:
-                    # Only if the reset time jumped significantly (new reset period)
-                    should_log = True
-
-                if should_log:
-                    self._last_logged_usage = (usage_percent, reset_time)
-
-            if should_log:
-                logger.info(
-                    "usage.snapshot",
-                    usage_percent=usage_percent,
+                logger.error(
+                    "usage.command.failed",
+                    return_code=return_code,
                 )
 
-            return usage_percent, reset_time
+        if not cleaned_output:
+            logger.warning("usage.command.empty_output")
+            return self._fallback_usage()
 
-        except RuntimeError:
-            raise
-        except Exception as e:
-            logger.error("usage.command.exception", error=str(e))
-            raise
+        # Parse output
+        try:
+            usage_percent, reset_time = self._parse_usage_output(cleaned_output)
+        except RuntimeError as parse_error:
+            logger.warning(
+                "usage.parse_failed",
+                error=str(parse_error),
+            )
+            return self._fallback_usage()
+
+        # Cache result
+        self.cached_usage = (usage_percent, reset_time)
+        self._last_check_monotonic = time.monotonic()
+
+        # Only log at significant milestones or major changes
+        # This reduces log noise from small fluctuations
+        previous_snapshot = self._last_logged_usage
+        should_log = self._should_log(previous_snapshot, usage_percent, reset_time)
+
+        # Always cache the first snapshot even if not logging
+        if should_log or previous_snapshot is None:
+            self._last_logged_usage = (usage_percent, reset_time)
+
+        if should_log:
+            logger.info(
+                "usage.snapshot",
+                usage_percent=usage_percent,
+                reset_time=self._format_reset_label(reset_time),
+            )
+
+        return usage_percent, reset_time
+
+    def _format_reset_label(self, reset_time: Optional[datetime]) -> str:
+        """Format a naive-UTC reset time for logs, in the CLI's timezone when known."""
+        if reset_time is None:
+            return "unknown"
 
-    def _execute_command(self, command_args: Tuple[str, ...]) -> Tuple[str, int]:
-        """Execute the configured CLI command and capture combined output."""
+        # f-strings avoid the locale-aware strftime path
+        tz = self._last_tzinfo if self.last_timezone_str else None
+        if tz is None:
+            return f"{reset_time.hour:02d}:{reset_time.minute:02d}:{reset_time.second:02d}"
+
+        local = reset_time.replace(tzinfo=timezone.utc).astimezone(tz)
+        meridiem = "am" if local.hour < 12 else "pm"
+        return f"{local.hour % 12 or 12:02d}:{local.minute:02d}{meridiem} ({self.last_timezone_str})"
+
+    @staticmethod
+    def _should_log(
+        previous_snapshot: Optional[Tuple[float, Optional[datetime]]],
+        usage_percent: float,
+        reset_time: Optional[datetime],
+    ) -> bool:
+        """Decide whether a usage snapshot is worth logging given the last logged one."""
+        if previous_snapshot is None:
+            # On first check, only log if usage is already significant (>=50%)
+            # This avoids startup noise when usage is low
+            return usage_percent >= 50.0
+
+        prev_percent, prev_reset = previous_snapshot
+
+        # Log at 10% milestones (50%, 60%, 70%, 80%, 90%, 100%)
+        current_milestone = int(usage_percent / 10) * 10
+        prev_milestone = int(prev_percent / 10) * 10
+        crossed_milestone = current_milestone != prev_milestone and current_milestone >= 50
+
+        # Log if crossed a milestone OR if we're near threshold (every % counts)
+        if crossed_milestone or usage_percent >= 80.0:
+            return True
+
+        # Also log if the reset time jumped (new day/period)
+        return bool(prev_reset and reset_time and reset_time != prev_reset)
+
+    def _execute_command(self, command_args: Tuple[str, ...]) -> Tuple[str, int, bool]:
+        """Execute the configured CLI command and capture combined output.
+
+        Returns:
+            Tuple of (output, return code, whether the output needs terminal cleanup)
+        """
 
         # Attempt PTY capture first to support interactive commands like "claude /usage".
         if self._supports_pty():
             with suppress(Exception):
-                return self._execute_with_pty(command_args)
+                output, return_code = self._execute_with_pty(command_args)
+                return output, return_code, True
 
         # Fall back to the simpler pipe-based execution.
-        return self._execute_with_pipes(command_args)
+        output, return_code = self._execute_with_pipes(command_args)
+        return output, return_code, False
 
     def _execute_with_pipes(self, command_args: Tuple[str, ...]) -> Tuple[str, int]:
         """Fallback execution path using plain stdout/stderr pipes."""
 
+        # An absolute executable path with close_fds=False lets subprocess spawn via
+        # posix_spawn instead of fork+exec. Python-created fds are non-inheritable (PEP 446),
+        # so nothing extra leaks into the child.
+        executable = shutil.which(command_args[0]) or command_args[0]
         process = subprocess.Popen(
             command_args,
+            executable=executable,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
+            close_fds=False,
         )
 
-        output = ""
-        stderr_output = ""
-        try:
-            output, stderr_output = process.communicate(timeout=5)
-        except subprocess.TimeoutExpired:
-            logger.debug("usage.command.timeout", mode="pipes", timeout_seconds=5)
-            process.terminate()
+        if sys.platform.startswith("win"):  # selectors cannot wait on pipes on Windows.
+            output = b""
+            stderr_output = b""
             try:
-                output, stderr_output = process.communicate(timeout=2)
+                output, stderr_output = process.communicate(timeout=5)
             except subprocess.TimeoutExpired:
-                process.kill()
-                output, stderr_output = process.communicate()
+                logger.debug("usage.command.timeout", mode="pipes", timeout_seconds=5)
+                process.terminate()
+                try:
+                    output, stderr_output = process.communicate(timeout=2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    output, stderr_output = process.communicate()
+            combined = (output or b"") + (stderr_output or b"")
+        else:
+            stdout_fd = process.stdout.fileno()
+            stderr_fd = process.stderr.fileno()
+            os.set_blocking(stdout_fd, False)
+            os.set_blocking(stderr_fd, False)
+            buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+
+            def collect(timeout: float) -> bool:
+                deadline = time.monotonic() + timeout
+                if not self._drain_fds(buffers, deadline):
+                    return False
+                with suppress(subprocess.TimeoutExpired):
+                    process.wait(timeout=max(0.0, deadline - time.monotonic()))
+                return process.poll() is not None
 
-        combined_output = (output or "") + (stderr_output or "")
-        return combined_output, process.returncode
+            try:
+                if not collect(5):
+                    logger.debug("usage.command.timeout", mode="pipes", timeout_seconds=5)
+                    process.terminate()
+                    if not collect(2):
+                        process.kill()
+                        process.wait()
+                        self._drain_fds(buffers, time.monotonic() + 2)
+            finally:
+                process.stdout.close()
+                process.stderr.close()
+            combined = buffers[stdout_fd] + buffers[stderr_fd]
+
+        # Match the universal-newline handling of text-mode pipes.
+        text = combined.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+        return text, process.returncode
 
     def _execute_with_pty(self, command_args: Tuple[str, ...]) -> Tuple[str, int]:
         """Execute the CLI command inside a PTY to capture interactive output."""
@@ -235,8 +350,8 @@ class ProPlanUsageChecker:
             raise RuntimeError("Pseudo-terminal capture not supported on this platform.")
 
         master_fd, slave_fd = pty.openpty()
-        env = os.environ.copy()
-        env.setdefault("TERM", "xterm-256color")
+        # Inherit the parent environment as-is unless TERM has to be added.
+        env = None if "TERM" in os.environ else {**os.environ, "TERM": "xterm-256color"}
 
         process = subprocess.Popen(
             command_args,
@@ -249,31 +364,29 @@ class ProPlanUsageChecker:
 
         os.close(slave_fd)
 
-        buffer: list[bytes] = []
+        buffer = bytearray()
+        buffers = {master_fd: buffer}
         os.set_blocking(master_fd, False)
 
-        try:
-            capture_deadline = time.monotonic() + 5
-            while time.monotonic() < capture_deadline:
-                if process.poll() is not None:
-                    break
-
-                ready, _, _ = select.select([master_fd], [], [], 0.1)
-                if master_fd in ready:
-                    try:
-                        chunk = os.read(master_fd, 4096)
-                    except OSError:
-                        break
-
-                    if not chunk:
-                        break
+        def shows_usage(chunk: bytes) -> bool:
+            return b"Resets" in chunk or b"% used" in chunk
 
-                    buffer.append(chunk)
+        def usage_complete(_chunk: bytes = b"") -> bool:
+            # The percentage plus a fully received reset line is everything the parser needs.
+            resets_at = buffer.find(b"Resets")
+            return resets_at != -1 and buffer.find(b"\n", resets_at) != -1 and b"% used" in buffer
 
-                    decoded = chunk.decode("utf-8", errors="ignore")
-                    if "Resets" in decoded or "% used" in decoded:
-                        # Slow down reading once we've seen the usage screen.
-                        capture_deadline = min(capture_deadline, time.monotonic() + 0.5)
+        try:
+            capture_deadline = time.monotonic() + 5
+            self._drain_fds(buffers, capture_deadline, process=process, stop=shows_usage)
+            # Slow down reading once we've seen the usage screen, and stop as soon as it is complete.
+            if not usage_complete():
+                self._drain_fds(
+                    buffers,
+                    min(capture_deadline, time.monotonic() + 0.5),
+                    process=process,
+                    stop=usage_complete,
+                )
 
             # Request the CLI to exit gracefully (Esc), fallback to Ctrl+C/terminate if needed.
             with suppress(OSError):
@@ -296,28 +409,71 @@ class ProPlanUsageChecker:
                 process.wait(timeout=2)
 
             # Drain any trailing output.
-            drain_deadline = time.monotonic() + 0.5
-            while time.monotonic() < drain_deadline:
-                ready, _, _ = select.select([master_fd], [], [], 0.1)
-                if master_fd not in ready:
-                    break
-                try:
-                    chunk = os.read(master_fd, 4096)
-                except OSError:
-                    break
-                if not chunk:
-                    break
-                buffer.append(chunk)
+            self._drain_fds(buffers, time.monotonic() + 0.5, until_idle=True)
         finally:
             os.close(master_fd)
 
-        combined = b"".join(buffer)
-        return combined.decode("utf-8", errors="ignore"), process.returncode
+        return buffer.decode("utf-8", errors="ignore"), process.returncode
+
+    @staticmethod
+    def _drain_fds(
+        buffers: Dict[int, bytearray],
+        deadline: float,
+        *,
+        process: Optional[subprocess.Popen] = None,
+        until_idle: bool = False,
+        stop: Optional[Callable[[bytes], bool]] = None,
+    ) -> bool:
+        """Read non-blocking fds into their buffers until every fd reaches EOF.
+
+        Reading also ends at the monotonic ``deadline``, when ``process`` exits, after an
+        idle poll interval if ``until_idle`` is set, or once ``stop(chunk)`` returns True.
+
+        Returns:
+            True if every fd reached EOF
+        """
+        remaining = set(buffers)
+        # DefaultSelector resolves to epoll/kqueue where available.
+        with selectors.DefaultSelector() as selector:
+            for fd in remaining:
+                selector.register(fd, selectors.EVENT_READ)
+
+            while remaining:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if process is not None and process.poll() is not None:
+                    break
+
+                events = selector.select(min(0.1, deadline - now))
+                if not events:
+                    if until_idle:
+                        break
+                    continue
+
+                for key, _ in events:
+                    try:
+                        chunk = os.read(key.fd, _READ_SIZE)
+                    except BlockingIOError:
+                        continue
+                    except OSError:  # EIO once the PTY slave side has closed
+                        chunk = b""
+
+                    if not chunk:
+                        selector.unregister(key.fd)
+                        remaining.discard(key.fd)
+                        continue
+
+                    buffers[key.fd].extend(chunk)
+                    if stop is not None and stop(chunk):
+                        return False
+
+        return not remaining
 
     @staticmethod
     def _supports_pty() -> bool:
         """Detect whether PTY capture is supported on this platform."""
-        if pty is None or select is None:
+        if pty is None:
             return False
         if sys.platform.startswith("win"):  # Windows lacks native PTY support.
             return False
@@ -332,14 +488,15 @@ class ProPlanUsageChecker:
 
         text = raw_output.replace("\r", "\n")
 
-        ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
-        osc_escape = re.compile(r"\x1B\][^\x07]*(\x07|\x1B\\)")
-
-        text = ansi_escape.sub("", text)
-        text = osc_escape.sub("", text)
+        # Plain output (no escapes, no control characters) skips the rewrite passes.
+        if "\x1B" in text:
+            text = _ANSI_ESC_RE.sub("", text)
+            text = _OSC_RE.sub("", text)
 
-        printable = set(string.printable + "\n")
-        text = ''.join(ch if ch in printable else ' ' for ch in text)
+        if _NON_PRINTABLE_RE.search(text):
+            text = text.translate(_PRINTABLE_TRANSLATE)
+            if not text.isascii():
+                text = _NON_ASCII_RE.sub(" ", text)
 
         lines = [line.rstrip() for line in text.splitlines()]
         cleaned_lines = [line for line in lines if line.strip()]
@@ -354,9 +511,13 @@ class ProPlanUsageChecker:
 
         # Primary format: "<number>% used"
         for line in lines:
-            if not re.search(r"(used|usage|messages|remaining|limit)", line, re.IGNORECASE):
+            # Substring checks are far cheaper than a regex search and reject most lines
+            if "%" not in line:
+                continue
+            lowered = line.lower()
+            if not any(keyword in lowered for keyword in _USAGE_KEYWORDS):
                 continue
-            match = re.search(r'(\d+(?:\.\d+)?)\s*%\s*(?:used|usage|of|remaining)?', line, re.IGNORECASE)
+            match = _PERCENT_RE.search(line)
             if match:
                 usage_percent = float(match.group(1))
                 logger.debug(
@@ -369,7 +530,10 @@ class ProPlanUsageChecker:
         # Ratios like "You have used 28 of 40 messages"
         if usage_percent is None:
             for line in lines:
-                match = re.search(r"used\s+(\d+)\s+of\s+(\d+)\s+messages", line, re.IGNORECASE)
+                lowered = line.lower()
+                if "of" not in lowered or "messages" not in lowered:
+                    continue
+                match = _USED_OF_TOTAL_RE.search(line)
                 if match:
                     used = int(match.group(1))
                     total = int(match.group(2))
@@ -387,7 +551,9 @@ class ProPlanUsageChecker:
         # Ratios like "Messages: 28/40"
         if usage_percent is None:
             for line in lines:
-                match = re.search(r"Messages?:\s*(\d+)\s*/\s*(\d+)", line, re.IGNORECASE)
+                if "/" not in line:
+                    continue
+                match = _MESSAGES_SLASH_RE.search(line)
                 if match:
                     used = int(match.group(1))
                     total = int(match.group(2))
@@ -405,10 +571,12 @@ class ProPlanUsageChecker:
         # Format "28 messages used, 12 remaining"
         if usage_percent is None:
             for line in lines:
-                match = re.search(r"(\d+)\s+messages?\s+used", line, re.IGNORECASE)
+                if "used" not in line.lower():
+                    continue
+                match = _USED_REMAINING_RE.search(line)
                 if match:
                     used = int(match.group(1))
-                    remaining_match = re.search(r"(\d+)\s+remaining", line, re.IGNORECASE)
+                    remaining_match = _REMAINING_RE.search(line)
                     if remaining_match:
                         remaining = int(remaining_match.group(1))
                         total = used + remaining
@@ -449,136 +617,129 @@ class ProPlanUsageChecker:
         Returns:
             datetime of reset, or None if can't parse
         """
+        # Every supported format contains "reset"; skip the scan when the CLI printed none.
+        if "reset" not in output.lower():
+            return None
+
         now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
 
-        # Try: "Resets 2:59am (America/New_York)" or "Resets 7pm (America/New_York)"
-        match = re.search(
-            r"Resets\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)\s+\(([^)]+)\)",
-            output,
-            re.IGNORECASE,
-        )
-        if match:
-            try:
-                hour = int(match.group(1))
-                minute = int(match.group(2)) if match.group(2) else 0
-                meridiem = match.group(3).lower()
-                timezone_str = match.group(4)  # e.g., "America/New_York"
-                self.last_timezone_str = timezone_str
-
-                if meridiem == "pm" and hour != 12:
-                    hour += 12
-                elif meridiem == "am" and hour == 12:
-                    hour = 0
-
-                reset_time = self._convert_with_timezone(hour, minute, 0, timezone_str)
-                if reset_time is None:
-                    reset_time = self._current_utc_with_time(hour, minute, 0, now_utc=now_utc)
-                logger.debug(
-                    "Parsed reset time: {:02d}:{:02d} {} ({}) → {}",
-                    hour % 24,
-                    minute,
-                    meridiem,
-                    timezone_str,
-                    reset_time.strftime("%Y-%m-%d %H:%M:%S"),
-                )
-                return reset_time
-            except ValueError as exc:
-                logger.warning(f"Failed to parse timezone format reset time: {exc}")
+        for match in _RESET_RE.finditer(output):
+            kind = match.lastgroup
 
-        # Try: "Resets at 00:24" or "Resets @ 00:24:59 UTC"
-        match = re.search(
-            r"Resets?\s+(?:at|@)\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(am|pm)?(?:\s+\(([^)]+)\)|\s+(UTC|GMT|[A-Za-z/_-]+))?",
-            output,
-            re.IGNORECASE,
-        )
-        if match:
-            try:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                second = int(match.group(3)) if match.group(3) else 0
-                meridiem = match.group(4).lower() if match.group(4) else None
-                timezone_str = match.group(5) or match.group(6)
-                if timezone_str:
+            # "Resets 2:59am (America/New_York)" or "Resets 7pm (America/New_York)"
+            if kind == "tz":
+                try:
+                    hour = int(match.group("tz_hour"))
+                    minute = int(match.group("tz_minute")) if match.group("tz_minute") else 0
+                    meridiem = match.group("tz_meridiem").lower()
+                    timezone_str = match.group("tz_label")  # e.g., "America/New_York"
+                    tz = self._resolve_timezone(timezone_str)
                     self.last_timezone_str = timezone_str
+                    self._last_tzinfo = tz
 
-                if meridiem:
                     if meridiem == "pm" and hour != 12:
                         hour += 12
                     elif meridiem == "am" and hour == 12:
                         hour = 0
 
-                reset_time = self._convert_with_timezone(hour, minute, second, timezone_str)
-                if reset_time is None:
-                    reset_time = self._current_utc_with_time(hour, minute, second, now_utc=now_utc)
-                return reset_time
-            except ValueError:
-                pass
-
-        # Try: "Resets in X hours Y minutes"
-        match = re.search(
-            r"Resets?\s+in\s+(\d+)\s*(?:hours?|h)?\s+(\d+)\s*(?:minutes?|m)?",
-            output,
-            re.IGNORECASE,
-        )
-        if match:
-            hours = int(match.group(1))
-            minutes = int(match.group(2))
-            return now_utc + timedelta(hours=hours, minutes=minutes)
-
-        # Try: "Resets in 3h"
-        match = re.search(r"Resets?\s+in\s+(\d+)\s*h", output, re.IGNORECASE)
-        if match:
-            hours = int(match.group(1))
-            return now_utc + timedelta(hours=hours)
-
-        # Try: "Resets in 45m"
-        match = re.search(r"Resets?\s+in\s+(\d+)\s*m", output, re.IGNORECASE)
-        if match:
-            minutes = int(match.group(1))
-            return now_utc + timedelta(minutes=minutes)
-
-        # Try: "Next reset: 14:30"
-        match = re.search(
-            r"Next\s+reset[:\s]+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(UTC|GMT)?",
-            output,
-            re.IGNORECASE,
-        )
-        if match:
-            try:
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                second = int(match.group(3)) if match.group(3) else 0
-                timezone_str = match.group(4)
-                if timezone_str:
-                    self.last_timezone_str = timezone_str
-                reset_time = self._convert_with_timezone(hour, minute, second, timezone_str)
-                if reset_time is None:
-                    reset_time = self._current_utc_with_time(hour, minute, second, now_utc=now_utc)
-                return reset_time
-            except ValueError:
-                pass
+                    reset_time = self._convert_with_tzinfo(hour, minute, 0, tz, now_utc=now_utc)
+                    if reset_time is None:
+                        reset_time = self._current_utc_with_time(hour, minute, 0, now_utc=now_utc)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Parsed reset time: {:02d}:{:02d} {} ({}) → {}",
+                            hour % 24,
+                            minute,
+                            meridiem,
+                            timezone_str,
+                            reset_time.strftime("%Y-%m-%d %H:%M:%S"),
+                        )
+                    return reset_time
+                except ValueError as exc:
+                    logger.warning(f"Failed to parse timezone format reset time: {exc}")
+
+            # "Resets at 00:24" or "Resets @ 00:24:59 UTC"
+            elif kind == "at":
+                try:
+                    hour = int(match.group("at_hour"))
+                    minute = int(match.group("at_minute"))
+                    second = int(match.group("at_second")) if match.group("at_second") else 0
+                    meridiem = match.group("at_meridiem").lower() if match.group("at_meridiem") else None
+                    timezone_str = match.group("at_label") or match.group("at_abbr")
+                    tz = self._resolve_timezone(timezone_str)
+                    if timezone_str:
+                        self.last_timezone_str = timezone_str
+                        self._last_tzinfo = tz
+
+                    if meridiem:
+                        if meridiem == "pm" and hour != 12:
+                            hour += 12
+                        elif meridiem == "am" and hour == 12:
+                            hour = 0
+
+                    reset_time = self._convert_with_tzinfo(hour, minute, second, tz, now_utc=now_utc)
+                    if reset_time is None:
+                        reset_time = self._current_utc_with_time(hour, minute, second, now_utc=now_utc)
+                    return reset_time
+                except ValueError:
+                    pass
+
+            # "Resets in X hours Y minutes" / "Resets in 3h 15m"
+            elif kind == "in_hm":
+                hours = int(match.group("in_hm_hours"))
+                minutes = int(match.group("in_hm_minutes"))
+                return now_utc + timedelta(hours=hours, minutes=minutes)
+
+            # "Resets in 3h"
+            elif kind == "in_h":
+                return now_utc + timedelta(hours=int(match.group("in_h_hours")))
+
+            # "Resets in 45m"
+            elif kind == "in_m":
+                return now_utc + timedelta(minutes=int(match.group("in_m_minutes")))
+
+            # "Next reset: 14:30"
+            elif kind == "next":
+                try:
+                    hour = int(match.group("next_hour"))
+                    minute = int(match.group("next_minute"))
+                    second = int(match.group("next_second")) if match.group("next_second") else 0
+                    timezone_str = match.group("next_label")
+                    tz = self._resolve_timezone(timezone_str)
+                    if timezone_str:
+                        self.last_timezone_str = timezone_str
+                        self._last_tzinfo = tz
+                    reset_time = self._convert_with_tzinfo(hour, minute, second, tz, now_utc=now_utc)
+                    if reset_time is None:
+                        reset_time = self._current_utc_with_time(hour, minute, second, now_utc=now_utc)
+                    return reset_time
+                except ValueError:
+                    pass
 
         return None
 
-    def _convert_with_timezone(
-        self,
+    @staticmethod
+    def _convert_with_tzinfo(
         hour: int,
         minute: int,
         second: int,
-        tz_label: Optional[str],
+        tz: Optional[tzinfo],
+        *,
+        now_utc: datetime,
     ) -> Optional[datetime]:
-        tzinfo = self._resolve_timezone(tz_label)
-        if tzinfo is None:
+        if tz is None:
             return None
 
-        local_now = datetime.now(tz=tzinfo)
+        # Derive local time from the parse's shared clock reading instead of reading it again
+        aware_now = now_utc.replace(tzinfo=timezone.utc)
+        local_now = aware_now if tz is timezone.utc else aware_now.astimezone(tz)
         reset_local = local_now.replace(hour=hour % 24, minute=minute, second=second, microsecond=0)
         if reset_local <= local_now:
             reset_local += timedelta(days=1)
         return reset_local.astimezone(timezone.utc).replace(tzinfo=None)
 
     @classmethod
-    def _resolve_timezone(cls, tz_label: Optional[str]) -> Optional[timezone]:
+    def _resolve_timezone(cls, tz_label: Optional[str]) -> Optional[tzinfo]:
         if tz_label is None:
             return None
 
@@ -586,6 +747,12 @@ class ProPlanUsageChecker:
         if not label:
             return None
 
+        return cls._resolve_timezone_label(label)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _resolve_timezone_label(cls, label: str) -> Optional[tzinfo]:
+        """Resolve a stripped label; cached so repeated labels skip alias normalization and tz lookup."""
         upper_label = label.upper()
         alias_target = cls.TIMEZONE_ALIASES.get(upper_label)
         if alias_target:
@@ -608,7 +775,7 @@ class ProPlanUsageChecker:
     @staticmethod
     def _parse_utc_offset(label: str) -> Optional[timezone]:
         sanitized = label.strip().upper().replace(" ", "")
-        match = re.fullmatch(r"(?:UTC|GMT)?([+-])(\d{1,2})(?::?(\d{2}))?", sanitized)
+        match = _UTC_OFFSET_RE.fullmatch(sanitized)
         if not match:
             return None
 
@@ -666,12 +833,12 @@ class ProPlanUsageChecker:
         """
         Provide cached usage if available, otherwise return a conservative default.
         """
-        if self.cached_usage and self.last_check_time:
+        if self.cached_usage and self._last_check_monotonic is not None:
             logger.debug("usage.cache.fallback")
             return self.cached_usage
 
         fallback = (0.0, None)
         self.cached_usage = fallback
-        self.last_check_time = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._last_check_monotonic = time.monotonic()
         logger.info("usage.fallback.default")
         return fallback